@@ -8,11 +8,20 @@ for the Customer Churn Prediction project.
 
 import pandas as pd
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Use the multithreaded pyarrow CSV parser when pyarrow is installed and
+# pandas supports it (engine="pyarrow" was added in pandas 1.4)
+_PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split(".")[:2])
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = "pyarrow" if _PANDAS_VERSION >= (1, 4) else "c"
+except ImportError:
+    _CSV_ENGINE = "c"
+
 
 def load_csv(filepath: str) -> pd.DataFrame:
     """
@@ -34,7 +43,61 @@ def load_csv(filepath: str) -> pd.DataFrame:
     if not path.exists():
         raise FileNotFoundError(f"Data file not found: {filepath}")
     
-    df = pd.read_csv(filepath)
+    df = pd.read_csv(filepath, engine=_CSV_ENGINE)
+    if _CSV_ENGINE == "pyarrow":
+        df = _match_c_parser(df, filepath)
+    logger.info(f"Loaded {len(df)} rows and {len(df.columns)} columns")
+    
+    return df
+
+
+def _match_c_parser(df: pd.DataFrame, filepath: str) -> pd.DataFrame:
+    """
+    Make a frame read by the pyarrow engine match the default C parser.
+    
+    pyarrow infers dates, times and timestamps, which the C parser leaves as
+    strings, so those columns are re-read with the C parser. pyarrow also
+    returns blank string cells as None instead of NaN.
+    """
+    obj_cols = df.select_dtypes(include="object").columns
+    temporal_cols = [
+        col for col in df.columns
+        if pd.api.types.is_datetime64_any_dtype(df[col])
+        or (col in obj_cols and pd.api.types.infer_dtype(df[col]) in ("date", "time"))
+    ]
+    if temporal_cols:
+        df[temporal_cols] = pd.read_csv(filepath, usecols=temporal_cols, engine="c")[temporal_cols]
+    
+    obj_cols = df.select_dtypes(include="object").columns
+    df[obj_cols] = df[obj_cols].where(df[obj_cols].notna())
+    return df
+
+
+def load_parquet(filepath: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Load data from a Parquet file.
+    
+    Parquet is columnar and stores column types, so reading it skips CSV text
+    parsing and dtype inference, and ``columns`` reads only the data needed.
+    Requires pyarrow.
+    
+    Args:
+        filepath: Path to the Parquet file
+        columns: Optional subset of columns to read
+        
+    Returns:
+        DataFrame containing the loaded data
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    logger.info(f"Loading data from {filepath}")
+    
+    path = Path(filepath)
+    if not path.exists():
+        raise FileNotFoundError(f"Data file not found: {filepath}")
+    
+    df = pd.read_parquet(filepath, columns=columns)
     logger.info(f"Loaded {len(df)} rows and {len(df.columns)} columns")
     
     return df
@@ -91,31 +154,33 @@ def validate_data(df: pd.DataFrame, required_columns: Optional[list] = None) ->
 
 
 # Sample data generator for testing/demos
-def generate_sample_data(n_samples: int = 1000) -> pd.DataFrame:
+def generate_sample_data(n_samples: int = 1000, random_state: int = 42) -> pd.DataFrame:
     """
     Generate synthetic customer churn data for demos and testing.
     
     Args:
         n_samples: Number of samples to generate
+        random_state: Seed for the random number generator
         
     Returns:
         DataFrame with synthetic churn data
     """
     import numpy as np
     
-    np.random.seed(42)
+    # Local generator: reproducible without reseeding numpy's global state
+    rng = np.random.default_rng(random_state)
     
     data = {
         "customer_id": range(1, n_samples + 1),
-        "tenure": np.random.randint(1, 72, n_samples),
-        "monthly_charges": np.random.uniform(20, 100, n_samples),
-        "total_charges": np.random.uniform(100, 5000, n_samples),
-        "contract_type": np.random.choice(["month-to-month", "one_year", "two_year"], n_samples),
-        "payment_method": np.random.choice(["credit_card", "bank_transfer", "electronic_check"], n_samples),
-        "internet_service": np.random.choice(["dsl", "fiber_optic", "no"], n_samples),
-        "tech_support": np.random.choice(["yes", "no"], n_samples),
-        "online_security": np.random.choice(["yes", "no"], n_samples),
-        "churn": np.random.choice([0, 1], n_samples, p=[0.73, 0.27]),
+        "tenure": rng.integers(1, 72, n_samples),
+        "monthly_charges": rng.uniform(20, 100, n_samples),
+        "total_charges": rng.uniform(100, 5000, n_samples),
+        "contract_type": rng.choice(["month-to-month", "one_year", "two_year"], n_samples),
+        "payment_method": rng.choice(["credit_card", "bank_transfer", "electronic_check"], n_samples),
+        "internet_service": rng.choice(["dsl", "fiber_optic", "no"], n_samples),
+        "tech_support": rng.choice(["yes", "no"], n_samples),
+        "online_security": rng.choice(["yes", "no"], n_samples),
+        "churn": rng.choice([0, 1], n_samples, p=[0.73, 0.27]),
     }
     
     df = pd.DataFrame(data)
@@ -140,6 +140,29 @@ def create_derived_features(df: pd.DataFrame) -> pd.DataFrame:
     return df_new
 
 
+def get_numeric_feature_columns(df: pd.DataFrame, exclude: Optional[List[str]] = None) -> List[str]:
+    """
+    List the numeric columns of a DataFrame, excluding e.g. target and ID columns.
+    
+    Columns are picked from the dtypes alone, so callers can select just these
+    columns with one copy instead of copying the frame first.
+    
+    Args:
+        df: Input DataFrame
+        exclude: Column names to leave out
+        
+    Returns:
+        List of numeric column names
+    """
+    excluded = set(exclude or [])
+    return [
+        col for col, dtype in df.dtypes.items()
+        if col not in excluded
+        and pd.api.types.is_numeric_dtype(dtype)
+        and not pd.api.types.is_bool_dtype(dtype)
+    ]
+
+
 def handle_missing_values(
     df: pd.DataFrame,
     numeric_strategy: str = "median",
@@ -157,26 +180,33 @@ def handle_missing_values(
         DataFrame with handled missing values
     """
     logger.info(f"Handling missing values: numeric={numeric_strategy}, categorical={categorical_strategy}")
-    df_clean = df.copy()
+    
+    # Find columns with nulls and compute their fill statistics with one
+    # frame-wide reduction each, rather than one per column
+    has_missing = df.isnull().any()
+    fill_values = {}
     
     # Handle numeric columns
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
-    for col in numeric_cols:
-        if df[col].isnull().any():
-            if numeric_strategy == "median":
-                df_clean[col].fillna(df[col].median(), inplace=True)
-            elif numeric_strategy == "mean":
-                df_clean[col].fillna(df[col].mean(), inplace=True)
-            elif numeric_strategy == "zero":
-                df_clean[col].fillna(0, inplace=True)
+    numeric_cols = [c for c in df.select_dtypes(include=[np.number]).columns if has_missing[c]]
+    if numeric_cols:
+        if numeric_strategy == "median":
+            fill_values.update(df[numeric_cols].median())
+        elif numeric_strategy == "mean":
+            fill_values.update(df[numeric_cols].mean())
+        elif numeric_strategy == "zero":
+            fill_values.update(dict.fromkeys(numeric_cols, 0))
     
     # Handle categorical columns
-    categorical_cols = df.select_dtypes(include=["object", "category"]).columns
-    for col in categorical_cols:
-        if df[col].isnull().any():
-            if categorical_strategy == "mode":
-                df_clean[col].fillna(df[col].mode()[0], inplace=True)
-            elif categorical_strategy == "unknown":
-                df_clean[col].fillna("unknown", inplace=True)
-    
-    return df_clean
+    categorical_cols = [
+        c for c in df.select_dtypes(include=["object", "category"]).columns if has_missing[c]
+    ]
+    if categorical_cols:
+        if categorical_strategy == "mode":
+            # An all-missing column has no mode and is left as is
+            modes = df[categorical_cols].mode()
+            if len(modes):
+                fill_values.update(modes.iloc[0].dropna())
+        elif categorical_strategy == "unknown":
+            fill_values.update(dict.fromkeys(categorical_cols, "unknown"))
+    
+    return df.fillna(fill_values)
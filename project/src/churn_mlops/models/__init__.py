@@ -15,20 +15,38 @@ import numpy as np
 import pandas as pd
 from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import (
-    accuracy_score,
-    classification_report,
-    confusion_matrix,
-    f1_score,
-    precision_score,
-    recall_score,
-    roc_auc_score,
-)
-from sklearn.model_selection import train_test_split, GridSearchCV
+from sklearn.metrics import confusion_matrix, roc_auc_score
+from sklearn.model_selection import GridSearchCV
 
 logger = logging.getLogger(__name__)
 
 
+def _metrics_from_confusion_matrix(cm: np.ndarray) -> Dict[str, float]:
+    """
+    Derive binary classification metrics from a 2x2 confusion matrix.
+    
+    Computing the matrix once and deriving every metric from its four counts
+    avoids a separate pass over the labels per metric. Undefined ratios are
+    reported as 0.0, matching sklearn's default zero_division behaviour.
+    
+    Args:
+        cm: Confusion matrix laid out as [[tn, fp], [fn, tp]]
+        
+    Returns:
+        Dictionary with accuracy, precision, recall and f1
+    """
+    tn, fp, fn, tp = cm.ravel()
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    
+    return {
+        "accuracy": float((tp + tn) / cm.sum()),
+        "precision": float(precision),
+        "recall": float(recall),
+        "f1": float(2 * precision * recall / (precision + recall)) if precision + recall else 0.0,
+    }
+
+
 class ChurnModel:
     """
     Wrapper class for churn prediction models.
@@ -55,6 +73,14 @@ class ChurnModel:
         },
     }
     
+    # Tree ensembles cast their input to float32 internally, so handing them
+    # float32 up front avoids a float64 copy of X on every predict call.
+    FLOAT32_MODEL_TYPES = {"random_forest"}
+    
+    # Forests build their trees on all cores during fit, but are reset to
+    # n_jobs=None afterwards so single-row predictions skip the thread pool.
+    PARALLEL_FIT_MODEL_TYPES = {"random_forest"}
+    
     def __init__(self, model_type: str = "random_forest", **kwargs):
         """
         Initialize the model.
@@ -87,7 +113,14 @@ class ChurnModel:
         """
         logger.info(f"Training model on {len(X)} samples")
         self.feature_names = list(X.columns) if isinstance(X, pd.DataFrame) else None
-        self.model.fit(X, y)
+        if self.model_type in self.PARALLEL_FIT_MODEL_TYPES and "n_jobs" not in self.params:
+            self.model.set_params(n_jobs=-1)
+            try:
+                self.model.fit(self._prepare_input(X), y)
+            finally:
+                self.model.set_params(n_jobs=None)
+        else:
+            self.model.fit(self._prepare_input(X), y)
         self._is_fitted = True
         logger.info("Model training complete")
         return self
@@ -105,7 +138,7 @@ class ChurnModel:
         if not self._is_fitted:
             raise ValueError("Model must be fitted before prediction")
         
-        return self.model.predict(X)
+        return self.model.predict(self._prepare_input(X))
     
     def predict_proba(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
         """
@@ -120,7 +153,31 @@ class ChurnModel:
         if not self._is_fitted:
             raise ValueError("Model must be fitted before prediction")
         
-        return self.model.predict_proba(X)
+        return self.model.predict_proba(self._prepare_input(X))
+    
+    def predict_with_proba(
+        self, X: Union[pd.DataFrame, np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get predictions and probabilities from a single model pass.
+        
+        sklearn's predict() is the argmax of predict_proba(), so deriving the
+        labels here avoids running the model twice.
+        
+        Args:
+            X: Feature matrix
+            
+        Returns:
+            Tuple of (predictions, probabilities)
+        """
+        probabilities = self.predict_proba(X)
+        return self.model.classes_[probabilities.argmax(axis=1)], probabilities
+    
+    def _prepare_input(self, X: Union[pd.DataFrame, np.ndarray]) -> Union[pd.DataFrame, np.ndarray]:
+        """Cast X to the dtype the underlying estimator computes in."""
+        if self.model_type in self.FLOAT32_MODEL_TYPES:
+            return X.astype(np.float32, copy=False)
+        return X
     
     def evaluate(self, X: pd.DataFrame, y: pd.Series) -> Dict[str, float]:
         """
@@ -133,15 +190,12 @@ class ChurnModel:
         Returns:
             Dictionary of evaluation metrics
         """
-        y_pred = self.predict(X)
-        y_proba = self.predict_proba(X)[:, 1]
+        y_pred, y_proba = self.predict_with_proba(X)
         
+        cm = confusion_matrix(y, y_pred, labels=[0, 1])
         metrics = {
-            "accuracy": accuracy_score(y, y_pred),
-            "precision": precision_score(y, y_pred),
-            "recall": recall_score(y, y_pred),
-            "f1": f1_score(y, y_pred),
-            "roc_auc": roc_auc_score(y, y_proba),
+            **_metrics_from_confusion_matrix(cm),
+            "roc_auc": roc_auc_score(y, y_proba[:, 1]),
         }
         
         logger.info(f"Evaluation metrics: {metrics}")
@@ -157,8 +211,11 @@ class ChurnModel:
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
         
+        # Protocol 5 (Python 3.8+) pickles numpy arrays, such as the tree
+        # node arrays, with less overhead than the default protocol. It is
+        # pinned so models stay loadable by older serving interpreters.
         with open(filepath, "wb") as f:
-            pickle.dump(self, f)
+            pickle.dump(self, f, protocol=5)
         
         logger.info(f"Model saved to {filepath}")
     
@@ -241,14 +298,21 @@ def hyperparameter_search(
             }
     
     model_class = ChurnModel.MODEL_TYPES[model_type]
-    base_model = model_class()
+    if model_type == "random_forest":
+        # Each forest already builds its trees on all cores, so run the search
+        # itself serially instead of nesting one pool inside another
+        base_model = model_class(n_jobs=-1)
+        search_n_jobs = 1
+    else:
+        base_model = model_class()
+        search_n_jobs = -1
     
     grid_search = GridSearchCV(
         base_model,
         param_grid,
         cv=cv,
         scoring="f1",
-        n_jobs=-1,
+        n_jobs=search_n_jobs,
     )
     
     logger.info(f"Starting hyperparameter search with {cv}-fold CV")
@@ -257,4 +321,8 @@ def hyperparameter_search(
     logger.info(f"Best parameters: {grid_search.best_params_}")
     logger.info(f"Best score: {grid_search.best_score_:.4f}")
     
-    return grid_search.best_estimator_, grid_search.best_params_
+    best_estimator = grid_search.best_estimator_
+    if model_type in ChurnModel.PARALLEL_FIT_MODEL_TYPES:
+        best_estimator.set_params(n_jobs=None)
+    
+    return best_estimator, grid_search.best_params_
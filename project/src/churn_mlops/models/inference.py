@@ -42,8 +42,17 @@ class ChurnPredictor:
             raise FileNotFoundError(f"Model not found at {self.model_path}")
         
         self.model = ChurnModel.load(self.model_path)
+        self._feature_names = tuple(self.model.feature_names or ())
         logger.info(f"Model loaded from {self.model_path}")
     
+    def _select_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Filter to only include features the model was trained on."""
+        if not self._feature_names:
+            return df
+        
+        columns = set(df.columns)
+        return df[[f for f in self._feature_names if f in columns]]
+    
     def predict(self, features: Dict[str, Union[float, int, str]]) -> Dict:
         """
         Make a single prediction.
@@ -60,22 +69,17 @@ class ChurnPredictor:
             }
         """
         # Convert to DataFrame
-        df = pd.DataFrame([features])
-        
-        # Filter to only include features the model was trained on
-        if self.model.feature_names:
-            available_features = [f for f in self.model.feature_names if f in df.columns]
-            df = df[available_features]
+        df = self._select_features(pd.DataFrame([features]))
         
         # Make prediction
-        prediction = self.model.predict(df)[0]
-        probabilities = self.model.predict_proba(df)[0]
+        predictions, probabilities = self.model.predict_with_proba(df)
+        prediction = predictions[0]
         
         result = {
             "prediction": int(prediction),
             "will_churn": bool(prediction == 1),
-            "churn_probability": float(probabilities[1]),
-            "confidence": float(max(probabilities)),
+            "churn_probability": float(probabilities[0, 1]),
+            "confidence": float(probabilities[0].max()),
         }
         
         logger.debug(f"Prediction result: {result}")
@@ -91,26 +95,58 @@ class ChurnPredictor:
         Returns:
             List of prediction results
         """
-        df = pd.DataFrame(features_list)
+        df = self._select_features(pd.DataFrame(features_list))
         
-        # Filter to only include features the model was trained on
-        if self.model.feature_names:
-            available_features = [f for f in self.model.feature_names if f in df.columns]
-            df = df[available_features]
+        return self._format_results(*self.model.predict_with_proba(df))
+    
+    def predict_array(self, X: np.ndarray) -> List[Dict]:
+        """
+        Make batch predictions from a feature matrix.
         
-        predictions = self.model.predict(df)
-        probabilities = self.model.predict_proba(df)
+        Skips building a DataFrame from per-customer dictionaries, which makes
+        this the cheaper path for large batches.
         
-        results = []
-        for i in range(len(predictions)):
-            results.append({
-                "prediction": int(predictions[i]),
-                "will_churn": bool(predictions[i] == 1),
-                "churn_probability": float(probabilities[i][1]),
-                "confidence": float(max(probabilities[i])),
-            })
+        Args:
+            X: 2-D array with one row per customer and one column per model
+               feature, in the order of the model's feature_names
+            
+        Returns:
+            List of prediction results
+            
+        Raises:
+            ValueError: If X does not have one column per model feature
+        """
+        if self._feature_names:
+            if X.ndim != 2 or X.shape[1] != len(self._feature_names):
+                raise ValueError(
+                    f"Expected rows of {len(self._feature_names)} features "
+                    f"{list(self._feature_names)}, got array of shape {X.shape}"
+                )
+            # Name the columns so sklearn can check them against training
+            X = pd.DataFrame(X, columns=list(self._feature_names), copy=False)
         
-        return results
+        return self._format_results(*self.model.predict_with_proba(X))
+    
+    @staticmethod
+    def _format_results(predictions: np.ndarray, probabilities: np.ndarray) -> List[Dict]:
+        """Convert prediction arrays into a list of result dictionaries."""
+        # Derive every column with one array op, then convert to Python
+        # scalars in bulk instead of boxing element by element
+        will_churn = (predictions == 1).tolist()
+        churn_probabilities = probabilities[:, 1].tolist()
+        confidences = probabilities.max(axis=1).tolist()
+        
+        return [
+            {
+                "prediction": int(prediction),
+                "will_churn": churn,
+                "churn_probability": churn_probability,
+                "confidence": confidence,
+            }
+            for prediction, churn, churn_probability, confidence in zip(
+                predictions.tolist(), will_churn, churn_probabilities, confidences
+            )
+        ]
 
 
 # Convenience function for simple inference
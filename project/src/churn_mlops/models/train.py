@@ -7,11 +7,17 @@ Main script for training the churn prediction model.
 
 import argparse
 import logging
+import numpy as np
 import yaml
 from pathlib import Path
 
 from churn_mlops.data import load_csv, generate_sample_data, validate_data
-from churn_mlops.features import FeatureEngineer, create_derived_features, handle_missing_values
+from churn_mlops.features import (
+    FeatureEngineer,
+    create_derived_features,
+    get_numeric_feature_columns,
+    handle_missing_values,
+)
 from churn_mlops.models import ChurnModel, train_model
 
 # Configure logging
@@ -74,13 +80,12 @@ def main(config_path: str = None):
     
     # Prepare features and target
     target_column = "churn"
-    feature_columns = [col for col in df.columns if col not in [target_column, "customer_id"]]
     
-    # Handle categorical columns for demo
-    df_numeric = df[feature_columns].select_dtypes(include=['number'])
+    # Handle categorical columns for demo: use numeric features only
+    feature_columns = get_numeric_feature_columns(df, exclude=[target_column, "customer_id"])
     
-    X = df_numeric
-    y = df[target_column]
+    X = df[feature_columns]
+    y = df[target_column].astype(np.int8)
     
     # Split data
     from sklearn.model_selection import train_test_split
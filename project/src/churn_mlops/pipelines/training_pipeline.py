@@ -11,8 +11,15 @@ import logging
 from datetime import datetime
 from typing import Dict, Optional
 
+import numpy as np
+
 from churn_mlops.data import generate_sample_data, validate_data
-from churn_mlops.features import FeatureEngineer, handle_missing_values, create_derived_features
+from churn_mlops.features import (
+    FeatureEngineer,
+    create_derived_features,
+    get_numeric_feature_columns,
+    handle_missing_values,
+)
 from churn_mlops.models import train_model
 
 logger = logging.getLogger(__name__)
@@ -60,7 +67,10 @@ class TrainingPipeline:
         
         # Step 1: Load data
         logger.info("Step 1: Loading data")
-        if data_path:
+        if data_path and data_path.endswith(".parquet"):
+            from churn_mlops.data import load_parquet
+            df = load_parquet(data_path)
+        elif data_path:
             from churn_mlops.data import load_csv
             df = load_csv(data_path)
         else:
@@ -84,11 +94,10 @@ class TrainingPipeline:
         exclude_cols = [target, "customer_id"]
         
         # For simplicity, use only numeric columns
-        df_numeric = df.select_dtypes(include=['number'])
-        feature_cols = [c for c in df_numeric.columns if c not in exclude_cols]
+        feature_cols = get_numeric_feature_columns(df, exclude=exclude_cols)
         
-        X = df_numeric[feature_cols]
-        y = df[target]
+        X = df[feature_cols]
+        y = df[target].astype(np.int8)
         
         # Step 6: Split data
         logger.info("Step 6: Splitting data")
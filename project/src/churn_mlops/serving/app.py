@@ -5,12 +5,15 @@ FastAPI Application for Churn Prediction
 This module provides a REST API for the churn prediction model.
 """
 
+import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
 
@@ -25,26 +28,23 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize FastAPI app
-app = FastAPI(
-    title="Customer Churn Prediction API",
-    description="REST API for predicting customer churn using machine learning",
-    version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-)
-
 # Model path from environment or default
 MODEL_PATH = os.getenv("MODEL_PATH", "models/churn_model.pkl")
 
-# Global predictor instance (lazy loaded)
+# Global predictor instance (loaded at startup, or lazily on first request)
 _predictor: Optional["ChurnPredictor"] = None
+_model_loading = False
 
 
 def get_predictor():
     """Get or create predictor instance."""
     global _predictor
     if _predictor is None:
+        if _model_loading:
+            raise HTTPException(
+                status_code=503,
+                detail="Model is still loading. Please retry shortly."
+            )
         if ChurnPredictor is None:
             raise HTTPException(
                 status_code=503,
@@ -59,6 +59,53 @@ def get_predictor():
     return _predictor
 
 
+def _load_predictor() -> None:
+    """Load the predictor from disk (runs in a worker thread at startup)."""
+    global _predictor, _model_loading
+    try:
+        _predictor = ChurnPredictor(MODEL_PATH)
+        logger.info(f"Model loaded at startup from {MODEL_PATH}")
+    except Exception as e:
+        logger.error(f"Failed to load model at startup: {e}")
+    finally:
+        _model_loading = False
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start loading the model in the background.
+    
+    Unpickling a large model blocks for a while, so it is done in the default
+    executor instead of the event loop. The server accepts connections right
+    away; /health reports model_loaded=False and predictions return 503 until
+    loading finishes. Shutdown waits for a load still in progress.
+    """
+    global _model_loading
+    loading = None
+    if ChurnPredictor is None or not Path(MODEL_PATH).exists():
+        logger.warning(f"No model found at {MODEL_PATH}; skipping startup load")
+    else:
+        _model_loading = True
+        loading = asyncio.get_running_loop().run_in_executor(None, _load_predictor)
+    
+    yield
+    
+    if loading is not None:
+        await loading
+
+
+# Initialize FastAPI app
+app = FastAPI(
+    title="Customer Churn Prediction API",
+    description="REST API for predicting customer churn using machine learning",
+    version="1.0.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    lifespan=lifespan,
+)
+
+
 # Request/Response Models
 class CustomerFeatures(BaseModel):
     """Input features for a single customer."""
@@ -102,6 +149,13 @@ class BatchPredictionRequest(BaseModel):
     customers: List[CustomerFeatures] = Field(..., description="List of customers")
 
 
+class ArrayPredictionRequest(BaseModel):
+    """Request body for batch predictions from a plain feature matrix."""
+    instances: List[List[float]] = Field(
+        ..., description="One row of feature values per customer, ordered as in /model/info"
+    )
+
+
 class BatchPredictionResponse(BaseModel):
     """Response for batch predictions."""
     predictions: List[PredictionResponse]
@@ -144,17 +198,10 @@ async def health_check():
     
     Returns the current status of the API and model.
     """
-    model_loaded = False
-    try:
-        if Path(MODEL_PATH).exists():
-            model_loaded = True
-    except Exception:
-        pass
-    
     return HealthResponse(
         status="healthy",
         timestamp=datetime.now().isoformat(),
-        model_loaded=model_loaded,
+        model_loaded=_predictor is not None,
         version="1.0.0",
     )
 
@@ -173,6 +220,8 @@ async def predict_single(customer: CustomerFeatures):
         
         return PredictionResponse(**result)
     
+    except HTTPException:
+        raise
     except FileNotFoundError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
@@ -201,6 +250,8 @@ async def predict_batch(request: BatchPredictionRequest):
             predicted_churners=predicted_churners,
         )
     
+    except HTTPException:
+        raise
     except FileNotFoundError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
@@ -208,6 +259,37 @@ async def predict_batch(request: BatchPredictionRequest):
         raise HTTPException(status_code=500, detail=f"Batch prediction failed: {str(e)}")
 
 
+@app.post("/predict/batch/array", response_model=BatchPredictionResponse, tags=["Predictions"])
+async def predict_batch_array(request: ArrayPredictionRequest):
+    """
+    Make predictions for a matrix of customer features.
+    
+    Each row must list the model's features in the order reported by
+    /model/info. Cheaper than /predict/batch for large batches.
+    """
+    try:
+        predictor = get_predictor()
+        X = np.asarray(request.instances, dtype=np.float32)
+        results = predictor.predict_array(X)
+        
+        predictions = [PredictionResponse(**r) for r in results]
+        predicted_churners = sum(1 for p in predictions if p.will_churn)
+        
+        return BatchPredictionResponse(
+            predictions=predictions,
+            total_customers=len(predictions),
+            predicted_churners=predicted_churners,
+        )
+    
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Batch prediction error: {e}")
+        raise HTTPException(status_code=500, detail=f"Batch prediction failed: {str(e)}")
+
+
 @app.get("/model/info", response_model=ModelInfoResponse, tags=["Model"])
 async def model_info():
     """
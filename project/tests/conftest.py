@@ -0,0 +1,52 @@
+"""
+Shared Test Fixtures
+====================
+"""
+
+import pytest
+import numpy as np
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+@pytest.fixture(scope="session")
+def sample_data():
+    """
+    Generate sample data for testing.
+    
+    Built once per test session and shared by every test module, so tests
+    must not modify it in place (take a .copy() first).
+    """
+    from churn_mlops.data import generate_sample_data
+    
+    df = generate_sample_data(n_samples=500)
+    # Use only numeric columns for simplicity
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    X = df[[c for c in numeric_cols if c not in ['churn', 'customer_id']]]
+    y = df['churn']
+    return X, y
+
+
+@pytest.fixture(scope="session")
+def train_test_data(sample_data):
+    """Split sample data into train and test sets."""
+    from sklearn.model_selection import train_test_split
+    X, y = sample_data
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=42
+    )
+    return X_train, X_test, y_train, y_test
+
+
+@pytest.fixture(scope="session")
+def fitted_model(train_test_data):
+    """Random forest fitted once on the training split, shared by read-only tests."""
+    from churn_mlops.models import ChurnModel
+    
+    X_train, X_test, y_train, y_test = train_test_data
+    model = ChurnModel(model_type="random_forest")
+    model.fit(X_train, y_train)
+    return model
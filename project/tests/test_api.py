@@ -5,8 +5,9 @@ Tests for API Endpoints
 
 import pytest
 from pathlib import Path
-import tempfile
 import os
+import threading
+import time
 
 # Add src to path for imports
 import sys
@@ -19,9 +20,9 @@ from fastapi.testclient import TestClient
 class TestAPIBasic:
     """Basic API tests that don't require a trained model."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def client(self):
-        """Create test client."""
+        """Create test client (shared by all tests in this class)."""
         from churn_mlops.serving.app import app
         return TestClient(app)
     
@@ -53,31 +54,17 @@ class TestAPIBasic:
 class TestAPIPredictions:
     """Tests for prediction endpoints (require trained model)."""
     
-    @pytest.fixture
-    def trained_model(self, tmp_path):
-        """Create and save a trained model for testing."""
-        from churn_mlops.data import generate_sample_data
-        from churn_mlops.models import ChurnModel
-        import numpy as np
-        
-        # Generate data
-        df = generate_sample_data(n_samples=500)
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        X = df[[c for c in numeric_cols if c not in ['churn', 'customer_id']]]
-        y = df['churn']
-        
-        # Train and save model
-        model = ChurnModel(model_type="random_forest")
-        model.fit(X, y)
-        
-        model_path = tmp_path / "test_model.pkl"
-        model.save(str(model_path))
+    @pytest.fixture(scope="module")
+    def trained_model(self, fitted_model, tmp_path_factory):
+        """Save the shared trained model for testing (once per module)."""
+        model_path = tmp_path_factory.mktemp("models") / "test_model.pkl"
+        fitted_model.save(str(model_path))
         
         return str(model_path)
     
     @pytest.fixture
-    def client_with_model(self, trained_model):
-        """Create test client with trained model."""
+    def app_module(self, trained_model):
+        """Reload the app module so it picks up the trained model path."""
         # Set model path environment variable BEFORE importing the app
         os.environ["MODEL_PATH"] = trained_model
         
@@ -89,8 +76,23 @@ class TestAPIPredictions:
         app_module._predictor = None
         importlib.reload(app_module)
         
+        return app_module
+    
+    @pytest.fixture
+    def client_with_model(self, app_module):
+        """Create test client with trained model (startup load not run)."""
         return TestClient(app_module.app)
     
+    @staticmethod
+    def _wait_until(condition, timeout=5.0):
+        """Poll condition until it holds or the timeout expires."""
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+    
     def test_predict_single(self, client_with_model):
         """Test single prediction endpoint."""
         payload = {
@@ -129,3 +131,85 @@ class TestAPIPredictions:
         assert "total_customers" in data
         assert data["total_customers"] == 2
         assert len(data["predictions"]) == 2
+    
+    def test_predict_batch_array(self, client_with_model):
+        """Test batch prediction endpoint with a plain feature matrix."""
+        # tenure, monthly_charges, total_charges
+        payload = {"instances": [[12, 50.0, 600.0], [36, 80.0, 2880.0]]}
+        
+        response = client_with_model.post("/predict/batch/array", json=payload)
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert data["total_customers"] == 2
+        assert len(data["predictions"]) == 2
+        assert all(0 <= p["churn_probability"] <= 1 for p in data["predictions"])
+    
+    def test_predict_batch_array_wrong_width(self, client_with_model):
+        """Test that rows with the wrong number of features are rejected."""
+        payload = {"instances": [[12, 50.0]]}
+        
+        response = client_with_model.post("/predict/batch/array", json=payload)
+        assert response.status_code == 400
+    
+    def test_health_reports_model_loaded(self, client_with_model):
+        """Test health check reports the model once it has been loaded."""
+        assert client_with_model.get("/health").json()["model_loaded"] is False
+        
+        payload = {"tenure": 24, "monthly_charges": 65.50, "total_charges": 1572.00}
+        client_with_model.post("/predict", json=payload)
+        
+        assert client_with_model.get("/health").json()["model_loaded"] is True
+    
+    def test_predict_while_model_loading(self, client_with_model):
+        """Test predictions return 503 while the model is loading."""
+        import churn_mlops.serving.app as app_module
+        
+        app_module._model_loading = True
+        try:
+            payload = {"tenure": 24, "monthly_charges": 65.50, "total_charges": 1572.00}
+            response = client_with_model.post("/predict", json=payload)
+            assert response.status_code == 503
+        finally:
+            app_module._model_loading = False
+    
+    def test_startup_loads_model_in_background(self, app_module, monkeypatch):
+        """Test the startup load reports model_loaded False, then True."""
+        release = threading.Event()
+        real_predictor = app_module.ChurnPredictor
+        
+        def slow_predictor(model_path):
+            release.wait(timeout=5)
+            return real_predictor(model_path)
+        
+        monkeypatch.setattr(app_module, "ChurnPredictor", slow_predictor)
+        payload = {"tenure": 24, "monthly_charges": 65.50, "total_charges": 1572.00}
+        
+        with TestClient(app_module.app) as client:
+            assert client.get("/health").json()["model_loaded"] is False
+            assert client.post("/predict", json=payload).status_code == 503
+            
+            release.set()
+            assert self._wait_until(
+                lambda: client.get("/health").json()["model_loaded"]
+            )
+            assert client.post("/predict", json=payload).status_code == 200
+    
+    def test_startup_load_failure_falls_back_to_lazy_load(self, app_module, monkeypatch):
+        """Test a failed startup load clears the loading flag and is retried lazily."""
+        real_predictor = app_module.ChurnPredictor
+        
+        def broken_predictor(model_path):
+            raise RuntimeError("corrupt model")
+        
+        monkeypatch.setattr(app_module, "ChurnPredictor", broken_predictor)
+        payload = {"tenure": 24, "monthly_charges": 65.50, "total_charges": 1572.00}
+        
+        with TestClient(app_module.app) as client:
+            assert self._wait_until(lambda: not app_module._model_loading)
+            assert app_module._predictor is None
+            assert client.get("/health").json()["model_loaded"] is False
+            
+            monkeypatch.setattr(app_module, "ChurnPredictor", real_predictor)
+            assert client.post("/predict", json=payload).status_code == 200
+            assert client.get("/health").json()["model_loaded"] is True
@@ -0,0 +1,107 @@
+"""
+Tests for Feature Engineering Module
+====================================
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from churn_mlops.features import (
+    get_numeric_feature_columns,
+    handle_missing_values,
+)
+
+
+@pytest.fixture
+def frame_with_missing():
+    """Small frame with gaps in numeric and categorical columns."""
+    return pd.DataFrame({
+        "tenure": [1.0, np.nan, 3.0, 10.0],
+        "monthly_charges": [20.0, 30.0, 40.0, 50.0],
+        "contract_type": ["monthly", None, "monthly", "yearly"],
+        "payment_method": ["card", "bank", "card", "bank"],
+    })
+
+
+class TestGetNumericFeatureColumns:
+    """Tests for the get_numeric_feature_columns function."""
+    
+    def test_selects_numeric_columns(self):
+        """Test that bool, category and object columns are left out."""
+        df = pd.DataFrame({
+            "tenure": [1, 2],
+            "monthly_charges": [20.0, 30.0],
+            "is_senior": [True, False],
+            "contract_type": pd.Categorical(["monthly", "yearly"]),
+            "payment_method": ["card", "bank"],
+        })
+        
+        assert get_numeric_feature_columns(df) == ["tenure", "monthly_charges"]
+    
+    def test_exclude(self):
+        """Test that excluded columns are left out."""
+        df = pd.DataFrame({"customer_id": [1, 2], "tenure": [1, 2], "churn": [0, 1]})
+        
+        assert get_numeric_feature_columns(df, exclude=["customer_id", "churn"]) == ["tenure"]
+
+
+class TestHandleMissingValues:
+    """Tests for the handle_missing_values function."""
+    
+    @pytest.mark.parametrize("strategy,expected", [
+        ("median", 3.0),
+        ("mean", 14.0 / 3),
+        ("zero", 0.0),
+    ])
+    def test_numeric_strategies(self, frame_with_missing, strategy, expected):
+        """Test each numeric fill strategy."""
+        result = handle_missing_values(frame_with_missing, numeric_strategy=strategy)
+        
+        assert result["tenure"].iloc[1] == pytest.approx(expected)
+        pd.testing.assert_series_equal(
+            result["monthly_charges"], frame_with_missing["monthly_charges"]
+        )
+    
+    @pytest.mark.parametrize("strategy,expected", [
+        ("mode", "monthly"),
+        ("unknown", "unknown"),
+    ])
+    def test_categorical_strategies(self, frame_with_missing, strategy, expected):
+        """Test each categorical fill strategy."""
+        result = handle_missing_values(frame_with_missing, categorical_strategy=strategy)
+        
+        assert result["contract_type"].iloc[1] == expected
+        pd.testing.assert_series_equal(
+            result["payment_method"], frame_with_missing["payment_method"]
+        )
+    
+    def test_no_missing_values_remain(self, frame_with_missing):
+        """Test that the default strategies fill every gap."""
+        result = handle_missing_values(frame_with_missing)
+        assert not result.isnull().any().any()
+    
+    def test_all_missing_categorical_column(self, frame_with_missing):
+        """Test that a column with no mode is left missing."""
+        df = frame_with_missing.assign(notes=pd.Series([None] * 4, dtype=object))
+        
+        result = handle_missing_values(df)
+        
+        assert result["notes"].isnull().all()
+        assert result["contract_type"].iloc[1] == "monthly"
+        
+        only_notes = handle_missing_values(df[["payment_method", "notes"]])
+        assert only_notes["notes"].isnull().all()
+    
+    def test_input_not_mutated(self, frame_with_missing):
+        """Test that the input frame is left unchanged."""
+        original = frame_with_missing.copy()
+        
+        handle_missing_values(frame_with_missing)
+        
+        pd.testing.assert_frame_equal(frame_with_missing, original)
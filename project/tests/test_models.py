@@ -4,7 +4,6 @@ Tests for Models Module
 """
 
 import pytest
-import pandas as pd
 import numpy as np
 from pathlib import Path
 import tempfile
@@ -14,46 +13,19 @@ import os
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from churn_mlops.models import ChurnModel, train_model
-from churn_mlops.data import generate_sample_data
-
-
-@pytest.fixture
-def sample_data():
-    """Generate sample data for testing."""
-    df = generate_sample_data(n_samples=500)
-    # Use only numeric columns for simplicity
-    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-    X = df[[c for c in numeric_cols if c not in ['churn', 'customer_id']]]
-    y = df['churn']
-    return X, y
-
-
-@pytest.fixture
-def train_test_data(sample_data):
-    """Split sample data into train and test sets."""
-    from sklearn.model_selection import train_test_split
-    X, y = sample_data
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42
-    )
-    return X_train, X_test, y_train, y_test
+from churn_mlops.models import ChurnModel, hyperparameter_search, train_model
 
 
 class TestChurnModel:
     """Tests for the ChurnModel class."""
     
-    def test_init_random_forest(self):
-        """Test initializing a random forest model."""
-        model = ChurnModel(model_type="random_forest")
-        assert model.model_type == "random_forest"
+    @pytest.mark.parametrize("model_type", ["random_forest", "logistic_regression"])
+    def test_init(self, model_type):
+        """Test initializing each supported model type."""
+        model = ChurnModel(model_type=model_type)
+        assert model.model_type == model_type
         assert not model._is_fitted
     
-    def test_init_logistic_regression(self):
-        """Test initializing a logistic regression model."""
-        model = ChurnModel(model_type="logistic_regression")
-        assert model.model_type == "logistic_regression"
-    
     def test_init_invalid_model_type(self):
         """Test that invalid model type raises error."""
         with pytest.raises(ValueError, match="Unknown model type"):
@@ -66,6 +38,17 @@ class TestChurnModel:
         model.fit(X, y)
         assert model._is_fitted
     
+    def test_fit_leaves_forest_single_threaded(self, fitted_model):
+        """Test that the fitted forest predicts without a thread pool."""
+        assert fitted_model.model.n_jobs is None
+    
+    def test_fit_keeps_explicit_n_jobs(self, sample_data):
+        """Test that a user-supplied n_jobs is not overridden."""
+        X, y = sample_data
+        model = ChurnModel(model_type="random_forest", n_estimators=10, n_jobs=2)
+        model.fit(X, y)
+        assert model.model.n_jobs == 2
+    
     def test_predict_before_fit(self, sample_data):
         """Test that predict before fit raises error."""
         X, y = sample_data
@@ -73,48 +56,75 @@ class TestChurnModel:
         with pytest.raises(ValueError, match="must be fitted"):
             model.predict(X)
     
-    def test_predict(self, train_test_data):
+    def test_predict(self, fitted_model, train_test_data):
         """Test model predictions."""
         X_train, X_test, y_train, y_test = train_test_data
-        model = ChurnModel(model_type="random_forest")
-        model.fit(X_train, y_train)
+        model = fitted_model
         
         predictions = model.predict(X_test)
         assert len(predictions) == len(X_test)
-        assert all(p in [0, 1] for p in predictions)
+        assert np.isin(predictions, [0, 1]).all()
     
-    def test_predict_proba(self, train_test_data):
+    def test_predict_proba(self, fitted_model, train_test_data):
         """Test probability predictions."""
         X_train, X_test, y_train, y_test = train_test_data
-        model = ChurnModel(model_type="random_forest")
-        model.fit(X_train, y_train)
+        model = fitted_model
         
         probas = model.predict_proba(X_test)
         assert probas.shape == (len(X_test), 2)
         assert np.allclose(probas.sum(axis=1), 1.0)
     
-    def test_evaluate(self, train_test_data):
+    def test_predict_with_proba(self, fitted_model, train_test_data):
+        """Test that single-pass predictions match predict and predict_proba."""
+        X_train, X_test, y_train, y_test = train_test_data
+        model = fitted_model
+        
+        predictions, probas = model.predict_with_proba(X_test)
+        np.testing.assert_array_equal(predictions, model.predict(X_test))
+        np.testing.assert_array_equal(probas, model.predict_proba(X_test))
+    
+    def test_prepare_input_dtype(self, sample_data):
+        """Test that tree models receive float32 input and linear models are untouched."""
+        X, y = sample_data
+        
+        rf = ChurnModel(model_type="random_forest")
+        assert (rf._prepare_input(X).dtypes == np.float32).all()
+        
+        lr = ChurnModel(model_type="logistic_regression")
+        assert lr._prepare_input(X) is X
+    
+    def test_evaluate(self, fitted_model, train_test_data):
         """Test model evaluation."""
         X_train, X_test, y_train, y_test = train_test_data
-        model = ChurnModel(model_type="random_forest")
-        model.fit(X_train, y_train)
+        model = fitted_model
         
         metrics = model.evaluate(X_test, y_test)
-        assert "accuracy" in metrics
-        assert "precision" in metrics
-        assert "recall" in metrics
-        assert "f1" in metrics
-        assert "roc_auc" in metrics
+        assert {"accuracy", "precision", "recall", "f1", "roc_auc"} <= metrics.keys()
         
         # All metrics should be between 0 and 1
         for metric, value in metrics.items():
             assert 0 <= value <= 1
     
-    def test_save_and_load(self, train_test_data):
+    def test_evaluate_matches_sklearn(self, fitted_model, train_test_data):
+        """Test that confusion-matrix metrics agree with sklearn's scorers."""
+        from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+        
+        X_train, X_test, y_train, y_test = train_test_data
+        model = fitted_model
+        
+        metrics = model.evaluate(X_test, y_test)
+        y_pred = model.predict(X_test)
+        assert metrics["accuracy"] == pytest.approx(accuracy_score(y_test, y_pred))
+        assert metrics["precision"] == pytest.approx(
+            precision_score(y_test, y_pred, zero_division=0)
+        )
+        assert metrics["recall"] == pytest.approx(recall_score(y_test, y_pred))
+        assert metrics["f1"] == pytest.approx(f1_score(y_test, y_pred))
+    
+    def test_save_and_load(self, fitted_model, train_test_data):
         """Test model saving and loading."""
         X_train, X_test, y_train, y_test = train_test_data
-        model = ChurnModel(model_type="random_forest")
-        model.fit(X_train, y_train)
+        model = fitted_model
         
         with tempfile.NamedTemporaryFile(suffix='.pkl', delete=False) as f:
             temp_path = f.name
@@ -159,3 +169,31 @@ class TestTrainModel:
         
         assert model.model_type == "logistic_regression"
         assert model._is_fitted
+
+
+class TestHyperparameterSearch:
+    """Tests for the hyperparameter_search function."""
+    
+    def test_hyperparameter_search(self, sample_data):
+        """Test that the search returns a fitted estimator and params from the grid."""
+        X, y = sample_data
+        param_grid = {"C": [0.1, 1.0, 10.0]}
+        best_model, best_params = hyperparameter_search(
+            X, y, model_type="logistic_regression", param_grid=param_grid, cv=3
+        )
+        
+        assert best_params["C"] in param_grid["C"]
+        assert len(best_model.predict(X)) == len(X)
+    
+    def test_hyperparameter_search_random_forest(self, sample_data):
+        """Test the random forest search, which parallelizes inside each forest."""
+        X, y = sample_data
+        param_grid = {"n_estimators": [10, 20], "max_depth": [3]}
+        best_model, best_params = hyperparameter_search(
+            X, y, model_type="random_forest", param_grid=param_grid, cv=3
+        )
+        
+        assert best_params["n_estimators"] in param_grid["n_estimators"]
+        assert best_model.max_depth == 3
+        assert best_model.n_jobs is None
+        assert len(best_model.predict(X)) == len(X)